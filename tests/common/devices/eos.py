@@ -1,12 +1,19 @@
 import ipaddress
 import json
 import logging
+import os
 import re
+import six
+import tempfile
 
 from tests.common.devices.base import AnsibleHostBase
 
 logger = logging.getLogger(__name__)
 
+_RE_OP_SPEED = re.compile(r'Operational Speed: (\S+)')
+_RE_SPEED_DUPLEX = re.compile(r'Speed/Duplex: (.+)')
+_RE_LEADING_DIGITS = re.compile(r'\d+')
+
 def _raise_err(msg):
         logger.error(msg)
         raise Exception(msg)
@@ -34,24 +41,21 @@ class EosHost(AnsibleHostBase):
         self.eos_passwd = eos_passwd
         self.shell_user = shell_user
         self.shell_passwd = shell_passwd
-        AnsibleHostBase.__init__(self, ansible_adhoc, hostname)
-        self.localhost = ansible_adhoc(inventory='localhost', connection='local', host_pattern="localhost")["localhost"]
-
-    def __getattr__(self, module_name):
-        if module_name.startswith('eos_'):
-            evars = {
-                'ansible_connection':'network_cli',
-                'ansible_network_os':'eos',
-                'ansible_user': self.eos_user,
-                'ansible_password': self.eos_passwd,
-                'ansible_ssh_user': self.eos_user,
-                'ansible_ssh_pass': self.eos_passwd,
-                'ansible_become_method': 'enable'
-            }
-        else:
-            if not self.shell_user or not self.shell_passwd:
-                raise Exception("Please specify shell_user and shell_passwd for {}".format(self.hostname))
-            evars = {
+        # Extra vars for running eos_* modules and shell modules, built once and reused for every module call
+        self._eos_evars = {
+            'ansible_connection':'network_cli',
+            'ansible_network_os':'eos',
+            'ansible_user': self.eos_user,
+            'ansible_password': self.eos_passwd,
+            'ansible_ssh_user': self.eos_user,
+            'ansible_ssh_pass': self.eos_passwd,
+            'ansible_become_method': 'enable'
+        }
+        self._shell_evars = None
+        # Kind of extra vars ('eos' or 'shell') currently applied to the variable manager
+        self._last_evars_kind = None
+        if self.shell_user and self.shell_passwd:
+            self._shell_evars = {
                 'ansible_connection':'ssh',
                 'ansible_network_os':'linux',
                 'ansible_user': self.shell_user,
@@ -60,7 +64,26 @@ class EosHost(AnsibleHostBase):
                 'ansible_ssh_pass': self.shell_passwd,
                 'ansible_become_method': 'sudo'
             }
-        self.host.options['variable_manager'].extra_vars.update(evars)
+        # Whether EOS accepts comma separated interface ranges, None until the first multiple interfaces config
+        self._supports_intf_range = None
+        # Per interface caches of autoneg mode and supported speeds, invalidated on port speed config changes
+        self._autoneg_cache = {}
+        self._speeds_cache = {}
+        AnsibleHostBase.__init__(self, ansible_adhoc, hostname)
+        self.localhost = ansible_adhoc(inventory='localhost', connection='local', host_pattern="localhost")["localhost"]
+
+    def _get_shell_evars(self):
+        if self._shell_evars is None:
+            raise Exception("Please specify shell_user and shell_passwd for {}".format(self.hostname))
+        return self._shell_evars
+
+    def __getattr__(self, module_name):
+        kind = 'eos' if module_name.startswith('eos_') else 'shell'
+        if kind != self._last_evars_kind:
+            # Extra vars only need to be updated when switching between eos and shell modules
+            evars = self._eos_evars if kind == 'eos' else self._get_shell_evars()
+            self.host.options['variable_manager'].extra_vars.update(evars)
+            self._last_evars_kind = kind
         return super(EosHost, self).__getattr__(module_name)
 
     def __str__(self):
@@ -76,9 +99,44 @@ class EosHost(AnsibleHostBase):
         logging.info('Shut interface [%s]' % interface_name)
         return out
 
+    def _config_interfaces_bulk(self, interfaces, line):
+        # Pass the config as an indented src block, eos_config drops repeated top level lines given in 'lines',
+        # which would leave only the first interface configured
+        config = ''.join('interface {}\n   {}\n'.format(interface_name, line) for interface_name in interfaces)
+        fd, src = tempfile.mkstemp(suffix='.cfg')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(config)
+            return self.eos_config(src=src, match='none')
+        finally:
+            os.remove(src)
+
+    def _config_interfaces_multiple(self, interfaces, line):
+        if self._supports_intf_range is not False:
+            # Errors are only ignored by the first call, which probes the interface range support
+            out = self.eos_config(
+                lines=[line],
+                parents=['interface {}'.format(','.join(interfaces))],
+                module_ignore_errors=self._supports_intf_range is None)
+            if not self._has_cli_cmd_failed(out):
+                self._supports_intf_range = True
+                return out
+            # Only a CLI syntax rejection means interface range is not supported, other errors are not cached
+            if 'Invalid input' not in out.get('msg', ''):
+                _raise_err('Failed to configure interfaces {}: {}'.format(','.join(interfaces), out.get('msg')))
+            logger.info('Interface range is not supported on {}, configure interfaces one by one'.format(self.hostname))
+            self._supports_intf_range = False
+        return self._config_interfaces_bulk(interfaces, line)
+
+    def shutdown_bulk(self, interfaces):
+        out = self._config_interfaces_bulk(interfaces, 'shutdown')
+        logging.info('Shut interfaces [%s]' % ','.join(interfaces))
+        return out
+
     def shutdown_multiple(self, interfaces):
-        intf_str = ','.join(interfaces)
-        return self.shutdown(intf_str)
+        out = self._config_interfaces_multiple(interfaces, 'shutdown')
+        logging.info('Shut interface [%s]' % ','.join(interfaces))
+        return out
 
     def no_shutdown(self, interface_name):
         out = self.eos_config(
@@ -87,9 +145,15 @@ class EosHost(AnsibleHostBase):
         logging.info('No shut interface [%s]' % interface_name)
         return out
 
+    def no_shutdown_bulk(self, interfaces):
+        out = self._config_interfaces_bulk(interfaces, 'no shutdown')
+        logging.info('No shut interfaces [%s]' % ','.join(interfaces))
+        return out
+
     def no_shutdown_multiple(self, interfaces):
-        intf_str = ','.join(interfaces)
-        return self.no_shutdown(intf_str)
+        out = self._config_interfaces_multiple(interfaces, 'no shutdown')
+        logging.info('No shut interface [%s]' % ','.join(interfaces))
+        return out
 
     def check_intf_link_state(self, interface_name):
         show_int_result = self.eos_command(
@@ -152,41 +216,42 @@ class EosHost(AnsibleHostBase):
         @param neigh_desc: bgp neighbor description
         @param state: target state
         """
-        neigh_ips = [ip.lower() for ip in neigh_ips]
-        neigh_ips_ok = []
-        neigh_desc_ok = []
+        neigh_ips = frozenset(ip.lower() for ip in neigh_ips)
+        neigh_desc = frozenset(neigh_desc)
+        neigh_ips_ok = set()
+        neigh_desc_ok = set()
         neigh_desc_available = False
 
-        out_v4 = self.eos_command(
-            commands=['show ip bgp summary | json'])
+        # Get both summaries in a single eos_command call
+        out = self.eos_command(
+            commands=['show ip bgp summary | json', 'show ipv6 bgp summary | json'])
+        out_v4 = out['stdout'][0]
+        out_v6 = out['stdout'][1]
         logging.info("ip bgp summary: {}".format(out_v4))
-
-        out_v6 = self.eos_command(
-            commands=['show ipv6 bgp summary | json'])
         logging.info("ipv6 bgp summary: {}".format(out_v6))
 
         # when bgpd is inactive, the bgp summary output: [{u'vrfs': {}, u'warnings': [u'BGP inactive']}]
-        if 'BGP inactive' in out_v4['stdout'][0].get('warnings', '') and 'BGP inactive' in out_v6['stdout'][0].get('warnings', ''):
+        if 'BGP inactive' in out_v4.get('warnings', '') and 'BGP inactive' in out_v6.get('warnings', ''):
             return False
 
         try:
-            for k, v in out_v4['stdout'][0]['vrfs']['default']['peers'].items():
+            for k, v in out_v4['vrfs']['default']['peers'].items():
                 if v['peerState'].lower() == state.lower():
-                    if k in neigh_ips:
-                        neigh_ips_ok.append(k)
+                    if k.lower() in neigh_ips:
+                        neigh_ips_ok.add(k.lower())
                     if 'description' in v:
                         neigh_desc_available = True
                         if v['description'] in neigh_desc:
-                            neigh_desc_ok.append(v['description'])
+                            neigh_desc_ok.add(v['description'])
 
-            for k, v in out_v6['stdout'][0]['vrfs']['default']['peers'].items():
+            for k, v in out_v6['vrfs']['default']['peers'].items():
                 if v['peerState'].lower() == state.lower():
                     if k.lower() in neigh_ips:
-                        neigh_ips_ok.append(k)
+                        neigh_ips_ok.add(k.lower())
                     if 'description' in v:
                         neigh_desc_available = True
                         if v['description'] in neigh_desc:
-                            neigh_desc_ok.append(v['description'])
+                            neigh_desc_ok.add(v['description'])
         except KeyError:
             # ignore any KeyError due to unexpected BGP summary output
             pass
@@ -212,13 +277,19 @@ class EosHost(AnsibleHostBase):
             raise Exception("Unable to execute template\n{}".format(res["stdout"]))
 
     def get_route(self, prefix):
-        cmd = 'show ip bgp' if ipaddress.ip_network(unicode(prefix)).version == 4 else 'show ipv6 bgp'
+        cmd = 'show ip bgp' if ipaddress.ip_network(six.text_type(prefix)).version == 4 else 'show ipv6 bgp'
         return self.eos_command(commands=[{
             'command': '{} {}'.format(cmd, prefix),
             'output': 'json'
         }])['stdout'][0]
 
+    def _invalidate_port_speed_cache(self, interface_name):
+        self._autoneg_cache.pop(interface_name, None)
+        self._speeds_cache.pop(interface_name, None)
+
     def get_auto_negotiation_mode(self, interface_name):
+        if interface_name in self._autoneg_cache:
+            return self._autoneg_cache[interface_name]
         output = self.eos_command(commands=[{
             'command': 'show interfaces %s status' % interface_name,
             'output': 'json'
@@ -226,12 +297,14 @@ class EosHost(AnsibleHostBase):
         if self._has_cli_cmd_failed(output):
             _raise_err('Failed to get auto neg state for {}: {}'.format(interface_name, output['msg']))
         autoneg_enabled = output['stdout'][0]['interfaceStatuses'][interface_name]['autoNegotiateActive']
+        self._autoneg_cache[interface_name] = autoneg_enabled
         return autoneg_enabled
 
     def _reset_port_speed(self, interface_name):
         out = self.eos_config(
                 lines=['default speed'],
                 parents=['interface {}'.format(interface_name)])
+        self._invalidate_port_speed_cache(interface_name)
         logger.debug('Reset port speed for %s: %s' % (interface_name, out))
         return not self._has_cli_cmd_failed(out)
 
@@ -245,6 +318,7 @@ class EosHost(AnsibleHostBase):
             out = self.eos_config(
                 lines=['speed auto %s' % speed_to_advertise],
                 parents=['interface {}'.format(interface_name)])
+            self._invalidate_port_speed_cache(interface_name)
             logger.debug('Set auto neg to {} for port {}: {}'.format(enabled, interface_name, out))
             return not self._has_cli_cmd_failed(out)
         return self._reset_port_speed(interface_name)
@@ -252,7 +326,7 @@ class EosHost(AnsibleHostBase):
 
     def get_speed(self, interface_name):
         output = self.eos_command(commands=['show interfaces %s transceiver properties' % interface_name])
-        found_txt = re.search(r'Operational Speed: (\S+)', output['stdout'][0])
+        found_txt = _RE_OP_SPEED.search(output['stdout'][0])
         if found_txt is None:
             _raise_err('Not able to extract interface %s speed from output: %s' % (interface_name, output['stdout']))
 
@@ -272,9 +346,13 @@ class EosHost(AnsibleHostBase):
 
         speed_mode = 'auto' if self.get_auto_negotiation_mode(interface_name) else 'forced'
         speed = speed[:-3] + 'gfull'
-        out = self.host.eos_config(
+        # Go through __getattr__ so that the eos connection extra vars are applied even when the
+        # auto negotiation mode above came from cache without a module call
+        out = self.eos_config(
                 lines=['speed {} {}'.format(speed_mode, speed)],
-                parents='interface %s' % interface_name)[self.hostname]
+                parents='interface %s' % interface_name,
+                module_ignore_errors=True)
+        self._invalidate_port_speed_cache(interface_name)
         logger.debug('Set force speed for port {} : {}'.format(interface_name, out))
         return not self._has_cli_cmd_failed(out)
 
@@ -287,10 +365,13 @@ class EosHost(AnsibleHostBase):
         Returns:
             list: A list of supported speed strings or None
         """
+        if interface_name in self._speeds_cache:
+            return list(self._speeds_cache[interface_name])
+
         commands = ['show interfaces {} capabilities'.format(interface_name), 'show interface {} hardware'.format(interface_name)]
         for command in commands:
             output = self.eos_command(commands=[command])
-            found_txt = re.search("Speed/Duplex: (.+)", output['stdout'][0])
+            found_txt = _RE_SPEED_DUPLEX.search(output['stdout'][0])
             if found_txt is not None:
                 break
 
@@ -300,6 +381,5 @@ class EosHost(AnsibleHostBase):
         speed_list = found_txt.groups()[0]
         speed_list = speed_list.split(',')
         speed_list.remove('auto')
-        def extract_speed_only(v):
-            return re.match('\d+', v.strip()).group() + '000'
-        return list(map(extract_speed_only, speed_list))
+        self._speeds_cache[interface_name] = [_RE_LEADING_DIGITS.match(v.strip()).group() + '000' for v in speed_list]
+        return list(self._speeds_cache[interface_name])
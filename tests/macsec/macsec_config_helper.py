@@ -1,8 +1,11 @@
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
+
 from tests.common.utilities import wait_until
 from macsec_helper import *
 
 
-def set_macsec_profile(host, profile_name, priority, cipher_suite, primary_cak, primary_ckn, policy, send_sci):
+def _set_macsec_profile_cmd(profile_name, priority, cipher_suite, primary_cak, primary_ckn, policy, send_sci):
     macsec_profile = {
         "priority": priority,
         "cipher_suite": cipher_suite,
@@ -15,60 +18,104 @@ def set_macsec_profile(host, profile_name, priority, cipher_suite, primary_cak,
         profile_name)
     for k, v in macsec_profile.items():
         cmd += " '{}' '{}' ".format(k, v)
-    host.command(cmd)
+    return cmd
+
+
+def _delete_macsec_profile_cmd(profile_name):
+    return "sonic-db-cli CONFIG_DB DEL 'MACSEC_PROFILE|{}'".format(profile_name)
+
+
+def _enable_macsec_port_cmd(port, profile_name):
+    return "sonic-db-cli CONFIG_DB HSET 'PORT|{}' 'macsec' '{}'".format(
+        port, profile_name)
+
+
+def _disable_macsec_port_cmd(port):
+    return "sonic-db-cli CONFIG_DB HDEL 'PORT|{}' 'macsec'".format(port)
+
+
+def _parallel_map_hosts(func, items):
+    # Hosts are independent, so run func for every host concurrently
+    if not items:
+        return []
+    pool = ThreadPool(min(32, len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _run_cmds_by_host(cmds_by_host):
+    # Run all commands of a host in a single shell invocation to save round-trips
+    def run_cmds(item):
+        host, cmds = item
+        host.shell(" && ".join(cmds))
+    _parallel_map_hosts(run_cmds, list(cmds_by_host.items()))
+
+
+def set_macsec_profile(host, profile_name, priority, cipher_suite, primary_cak, primary_ckn, policy, send_sci):
+    host.command(_set_macsec_profile_cmd(profile_name, priority, cipher_suite,
+                                         primary_cak, primary_ckn, policy, send_sci))
 
 
 def delete_macsec_profile(host, profile_name):
-    cmd = "sonic-db-cli CONFIG_DB DEL 'MACSEC_PROFILE|{}'".format(profile_name)
-    host.command(cmd)
+    host.command(_delete_macsec_profile_cmd(profile_name))
 
 
 def enable_macsec_port(host, port, profile_name):
-    cmd = "sonic-db-cli CONFIG_DB HSET 'PORT|{}' 'macsec' '{}'".format(
-        port, profile_name)
-    host.command(cmd)
+    host.command(_enable_macsec_port_cmd(port, profile_name))
 
 
 def disable_macsec_port(host, port):
-    cmd = "sonic-db-cli CONFIG_DB HDEL 'PORT|{}' 'macsec'".format(port)
-    host.command(cmd)
+    host.command(_disable_macsec_port_cmd(port))
 
 
 def cleanup_macsec_configuration(duthost, ctrl_links, profile_name):
-    devices = set()
-    devices.add(duthost)
+    cmds_by_host = defaultdict(list)
     for dut_port, nbr in ctrl_links.items():
-        disable_macsec_port(duthost, dut_port)
-        disable_macsec_port(nbr["host"], nbr["port"])
-        delete_macsec_profile(nbr["host"], profile_name)
-        devices.add(nbr["host"])
-    delete_macsec_profile(duthost, profile_name)
-    # Waiting for all mka session were cleared in all devices
-    for d in devices:
-        assert wait_until(30, 1, 0, lambda: not get_mka_session(d))
+        cmds_by_host[duthost].append(_disable_macsec_port_cmd(dut_port))
+        cmds_by_host[nbr["host"]].append(_disable_macsec_port_cmd(nbr["port"]))
+        cmds_by_host[nbr["host"]].append(_delete_macsec_profile_cmd(profile_name))
+    cmds_by_host[duthost].append(_delete_macsec_profile_cmd(profile_name))
+    _run_cmds_by_host(cmds_by_host)
+    # Waiting for all mka session were cleared in all devices, poll all devices concurrently
+    devices = list(cmds_by_host.keys())
+
+    def all_mka_session_cleared():
+        return not any(_parallel_map_hosts(get_mka_session, devices))
+    assert wait_until(30, 1, 0, all_mka_session_cleared)
 
 
 def setup_macsec_configuration(duthost, ctrl_links, profile_name, default_priority,
                                cipher_suite, primary_cak, primary_ckn, policy, send_sci):
-    set_macsec_profile(duthost, profile_name, default_priority,
-                       cipher_suite, primary_cak, primary_ckn, policy, send_sci)
+    cmds_by_host = defaultdict(list)
+    cmds_by_host[duthost].append(_set_macsec_profile_cmd(profile_name, default_priority, cipher_suite,
+                                                         primary_cak, primary_ckn, policy, send_sci))
     i = 0
     for dut_port, nbr in ctrl_links.items():
-        enable_macsec_port(duthost, dut_port, profile_name)
+        cmds_by_host[duthost].append(_enable_macsec_port_cmd(dut_port, profile_name))
         if i % 2 == 0:
             priority = default_priority - 1
         else:
             priority = default_priority + 1
-        set_macsec_profile(nbr["host"], profile_name, priority,
-                           cipher_suite, primary_cak, primary_ckn, policy, send_sci)
-        enable_macsec_port(nbr["host"], nbr["port"], profile_name)
+        cmds_by_host[nbr["host"]].append(_set_macsec_profile_cmd(profile_name, priority, cipher_suite,
+                                                                 primary_cak, primary_ckn, policy, send_sci))
+        cmds_by_host[nbr["host"]].append(_enable_macsec_port_cmd(nbr["port"], profile_name))
         i += 1
+    _run_cmds_by_host(cmds_by_host)
 
 
 def startup_all_ctrl_links(ctrl_links):
     # The ctrl links may be shutdowned by unexpected exit on the TestFaultHandling
     # So, startup all ctrl links
+    ports_by_host = defaultdict(list)
     for _, nbr in ctrl_links.items():
-        nbr_eth_port = get_eth_ifname(
-            nbr["host"], nbr["port"])
-        nbr["host"].shell("ifconfig {} up".format(nbr_eth_port))
+        ports_by_host[nbr["host"]].append(nbr["port"])
+
+    def startup_links(item):
+        host, ports = item
+        for port in ports:
+            nbr_eth_port = get_eth_ifname(host, port)
+            host.shell("ifconfig {} up".format(nbr_eth_port))
+    _parallel_map_hosts(startup_links, list(ports_by_host.items()))
@@ -678,12 +678,8 @@ class CheckMockerResultMixin(object):
 
         :return: True if match else False.
         """
-        expected = {}
-        for name, fields in self.expected_data.items():
-            data = {}
-            for idx, header in enumerate(self.expected_data_headers):
-                data[header] = fields[idx]
-            expected[name] = data
+        headers = self.expected_data_headers
+        expected = {name: dict(zip(headers, fields)) for name, fields in self.expected_data.items()}
 
         logging.info("Expected: {}".format(json.dumps(expected, indent=2)))
         logging.info("Actual: {}".format(json.dumps(actual_data, indent=2)))
@@ -695,13 +691,10 @@ class CheckMockerResultMixin(object):
             if not primary in expected:
                 extra_in_actual_data.append(actual_data_item)
             else:
-                for field in actual_data_item.keys():
-                    if field in self.excluded_fields:
-                        continue
-                    if actual_data_item[field] != expected[primary][field]:
-                        mismatch_in_actual_data.append(actual_data_item)
-                        break
-                expected.pop(primary)
+                expected_item = expected.pop(primary)
+                if any(value != expected_item[field] for field, value in actual_data_item.items()
+                       if field not in self.excluded_fields):
+                    mismatch_in_actual_data.append(actual_data_item)
 
         result = True
         if len(extra_in_actual_data) > 0:
@@ -1,13 +1,10 @@
 import logging
-import time
 import os
 
 import pytest
 
 from tests.common.utilities import wait_until
 from tests.common.helpers.assertions import pytest_assert
-from tests.common.config_reload import config_reload
-from tests.common.reboot import reboot
 
 DUT_THERMAL_POLICY_FILE = '/usr/share/sonic/device/{}/thermal_policy.json'
 DUT_THERMAL_POLICY_BACKUP_FILE = '/usr/share/sonic/device/{}/thermal_policy.json.bak'
@@ -19,7 +16,41 @@ daemon_name = "thermalctld"
 expected_running_status = "RUNNING"
 expected_stopped_status = "STOPPED"
 
-class BaseMocker:
+# Cache of DUT platform strings, keyed by DUT hostname
+_dut_platforms = {}
+
+
+def _get_platform(dut):
+    """
+    Get platform string of a DUT, the DUT facts are only read once per DUT.
+    :param dut: DUT object representing a SONiC switch under test.
+    :return: Platform string of the DUT.
+    """
+    if dut.hostname not in _dut_platforms:
+        _dut_platforms[dut.hostname] = dut.facts['platform']
+    return _dut_platforms[dut.hostname]
+
+
+# Cache of thermal policy file and backup file paths, keyed by platform string
+_policy_paths_cache = {}
+
+
+def _policy_paths(platform_str):
+    """
+    Get thermal policy file path and its backup file path on DUT for a platform.
+    :param platform_str: Platform string of a DUT.
+    :return: A tuple of thermal policy file path and backup file path.
+    """
+    if platform_str not in _policy_paths_cache:
+        _policy_paths_cache[platform_str] = (DUT_THERMAL_POLICY_FILE.format(platform_str),
+                                             DUT_THERMAL_POLICY_BACKUP_FILE.format(platform_str))
+    return _policy_paths_cache[platform_str]
+
+
+# Registry of mocker types by name, shared by BaseMocker and module level lookups.
+_MOCKER_TYPES = {}
+
+class BaseMocker(object):
     """
     @summary: Base class for thermal control data mocker
 
@@ -27,7 +58,9 @@ class BaseMocker:
     vendor must be a subclass of this base class.
     """
     # Mocker type dictionary. Vendor must register their concrete mocker class to this dictionary.
-    _mocker_type_dict = {}
+    _mocker_type_dict = _MOCKER_TYPES
+
+    __slots__ = ('dut',)
 
     def __init__(self, dut):
         """
@@ -46,9 +79,9 @@ class BaseMocker:
     def check_result(self, actual_data):
         """
         Check actual data with mocked data.
-        :param actual_data: A dictionary contains actual command line data. Key of the dictionary is the unique id
-                            of a line of command line data. For 'show platform fan', the key is FAN name. Value
-                            of the dictionary is a list of field values for a line.
+        :param actual_data: A list of dictionary contains actual command line data as returned by
+                            dut.show_and_parse. Each dictionary is a line of command line data, key of the
+                            dictionary is the column header and value is the field value.
         :return: True if actual data match mocked data else False
         """
         pass
@@ -77,7 +110,7 @@ class BaseMocker:
         :param name: Name of a mocker type. For example: FanStatusMocker.
         :return: Class of a mocker.
         """
-        return cls._mocker_type_dict[name] if name in cls._mocker_type_dict else None
+        return _MOCKER_TYPES.get(name)
 
 
 def mocker(type_name):
@@ -92,10 +125,33 @@ def mocker(type_name):
     return wrapper
 
 
+def _load_vendor_mockers(platform):
+    """
+    Import vendor specific mocker module so that its mocker types are registered.
+    :param platform: Platform string of a DUT.
+    :return:
+    """
+    if 'mlnx' in platform:
+        from tests.platform_tests.mellanox import mellanox_thermal_control_test_helper
+
+
+@pytest.fixture(scope="module")
+def mocker_platform(duthosts, enum_rand_one_per_hwsku_hostname):
+    """
+    Module scoped part of mocker_factory. Get DUT platform and load vendor mocker types once per module.
+    :return: Platform string of the DUT.
+    """
+    duthost = duthosts[enum_rand_one_per_hwsku_hostname]
+    platform = _get_platform(duthost)
+    _load_vendor_mockers(platform)
+    return platform
+
+
 @pytest.fixture
-def mocker_factory(localhost, duthosts, enum_rand_one_per_hwsku_hostname):
+def mocker_factory(localhost, duthosts, enum_rand_one_per_hwsku_hostname, mocker_platform):
     """
-    Fixture for thermal control data mocker factory.
+    Fixture for thermal control data mocker factory. Mockers created by a test are de-initialized
+    when the test finishes, while the platform lookup and vendor mocker loading are done once per module.
     :return: A function for creating thermal control related data mocker.
     """
     mockers = []
@@ -108,11 +164,12 @@ def mocker_factory(localhost, duthosts, enum_rand_one_per_hwsku_hostname):
         :param mocker_name: Name of a mocker type.
         :return: Created mocker instance.
         """
-        platform = dut.facts['platform']
+        platform = _get_platform(dut)
+        if platform != mocker_platform:
+            _load_vendor_mockers(platform)
         mocker_object = None
 
         if 'mlnx' in platform:
-            from tests.platform_tests.mellanox import mellanox_thermal_control_test_helper
             mocker_type = BaseMocker.get_mocker_type(mocker_name)
             if mocker_type:
                 mocker_object = mocker_type(dut)
@@ -127,6 +184,7 @@ def mocker_factory(localhost, duthosts, enum_rand_one_per_hwsku_hostname):
         for m in mockers:
             m.deinit()
     except Exception as e:
+        from tests.common.reboot import reboot
         reboot(duthost, localhost)
         assert 0, "Caught exception while recovering from mock - {}".format(repr(e))
 
@@ -137,6 +195,8 @@ class FanStatusMocker(BaseMocker):
     This class could mock speed, presence/absence and so on for all FANs and check
     the actual data equal to the mocked data.
     """
+    __slots__ = ()
+
     def check_all_fan_speed(self, expected_speed):
         """
         Check all fan speed with a given expect value.
@@ -152,6 +212,7 @@ class SingleFanMocker(BaseMocker):
     This class could mock speed, presence/absence for one FAN, check LED color and
     other information.
     """
+    __slots__ = ()
     def is_fan_removable(self):
         """
         :return: True if FAN is removable else False
@@ -215,6 +276,8 @@ class ThermalStatusMocker(BaseMocker):
     This class could mock temperature, high threshold, high critical threshold and so on for all
     FANs and check the actual data equal to the mocked data.
     """
+    __slots__ = ()
+
     def check_thermal_algorithm_status(self, expected_status):
         """
         Check thermal control algorithm status equal to the given value.
@@ -224,16 +287,24 @@ class ThermalStatusMocker(BaseMocker):
         pass
 
 
-def check_cli_output_with_mocker(dut, mocker_object, command, max_wait_time, key_index=0):
+def check_cli_output_with_mocker(dut, mocker_object, command, max_wait_time=5, key_index=0, poll_interval=1):
     """
     Check the command line output matches the mocked data.
     :param dut: DUT object representing a SONiC switch under test.
     :param mocker_object: A mocker instance.
     :param command: The command to be executed. E.g, 'show platform fan'
-    :param max_wait_time: Max wait time.
+    :param max_wait_time: Max wait time in seconds for the output to match the mocked data.
+    :param key_index: Index of the key column in the command output.
+    :param poll_interval: Interval in seconds between two reads of the command output.
     :return: True if the actual data matches the mocked data.
     """
-    time.sleep(max_wait_time)
+    def _check_output():
+        parsed_output = dut.show_and_parse(command)
+        return len(parsed_output) > 0 and mocker_object.check_result(parsed_output)
+
+    # Poll the output instead of always sleeping max_wait_time, the mocked data usually shows up earlier
+    if wait_until(max_wait_time, poll_interval, 0, _check_output):
+        return
 
     parsed_output = dut.show_and_parse(command)
     assert len(parsed_output) > 0, "Run and parse output of command '{}' failed".format(command)
@@ -254,10 +325,36 @@ def check_thermal_algorithm_status(dut, mocker_factory, expected_status):
         return thermal_mocker.check_thermal_algorithm_status(expected_status)
     return True  # if vendor doesn't provide a thermal mocker, ignore this check by return True.
 
+def _pmon_run(dut, script, **kwargs):
+    """
+    Run a bash script inside pmon container with a single docker exec. Callers should put all the
+    commands needed at once into the script rather than calling this repeatedly.
+    :param dut: DUT object representing a SONiC switch under test.
+    :param script: Bash script to run, must not contain single quotes.
+    :param kwargs: Extra arguments passed to dut.shell.
+    :return: Result of dut.shell.
+    """
+    return dut.shell("docker exec -i pmon bash -c '{}'".format(script), **kwargs)
+
 def check_expected_daemon_status(duthost, expected_daemon_status):
     daemon_status, _ = duthost.get_pmon_daemon_status(daemon_name)
     return daemon_status == expected_daemon_status
 
+def _wait_daemon_status(dut, expected_daemon_status, timeout=10):
+    """
+    Wait for thermal control daemon to reach the expected status. The polling is done by a loop
+    inside pmon so that only one round-trip to the DUT is needed.
+    :param dut: DUT object representing a SONiC switch under test.
+    :param expected_daemon_status: Expected supervisor status of the daemon, e.g. RUNNING.
+    :param timeout: Max seconds to wait.
+    :return: True if the daemon reached the expected status in time.
+    """
+    wait_daemon_script = 'for i in $(seq 1 {0}); do set -- $(supervisorctl status {1}); ' \
+                         '[ "$2" = {2} ] && exit 0; sleep 1; done; exit 1'.format(timeout,
+                                                                                 daemon_name,
+                                                                                 expected_daemon_status)
+    return _pmon_run(dut, wait_daemon_script, module_ignore_errors=True)["rc"] == 0
+
 def restart_thermal_control_daemon(dut):
     """
     Restart thermal control daemon by killing it and waiting supervisord to restart
@@ -269,25 +366,29 @@ def restart_thermal_control_daemon(dut):
         logging.info("thermalctl daemon is not present")
         return
     logging.info('Restarting thermal control daemon on {}...'.format(dut.hostname))
-    find_thermalctld_pid_cmd = 'docker exec -i pmon bash -c \'pgrep -f thermalctld\' | sort'
-    output = dut.shell(find_thermalctld_pid_cmd)
-    assert output["rc"] == 0, "Run command '%s' failed" % find_thermalctld_pid_cmd
+    # Count thermalctld processes, restart thermalctld and wait for its processes to come back in a single
+    # round-trip. The daemon name is split in the script so that pgrep does not match the bash running it.
     # Usually there should be 2 thermalctld processes, but there is chance that
     # sonic platform API might use subprocess which creates extra thermalctld process.
     # For example, chassis.get_all_sfps will call sfp constructor, and sfp constructor may
     # use subprocess to call ethtool to do initialization.
     # So we check here thermalcltd must have at least 2 processes.
-    assert len(output["stdout_lines"]) >= 2, "There should be at least 2 thermalctld process"
-
-    restart_thermalctl_cmd = "docker exec -i pmon bash -c 'supervisorctl restart thermalctld'"
-    output = dut.shell(restart_thermalctl_cmd)
+    restart_thermalctld_script = 'd=thermalctl""d; ' \
+                                 'pre=$(pgrep -cf "$d"); echo PRE=$pre; [ $pre -ge 2 ] || exit 2; ' \
+                                 'supervisorctl restart "$d" || exit 1; ' \
+                                 'for i in $(seq 1 10); do post=$(pgrep -cf "$d"); ' \
+                                 '[ $post -ge 2 ] && break; sleep 1; done; echo POST=$post'
+    output = _pmon_run(dut, restart_thermalctld_script, module_ignore_errors=True)
+    process_counts = dict(line.split('=', 1) for line in output["stdout_lines"] if '=' in line)
+    assert 'PRE' in process_counts, "Run script '%s' in pmon failed" % restart_thermalctld_script
+    assert int(process_counts['PRE']) >= 2, "There should be at least 2 thermalctld process"
     if output["rc"] == 0:
-        output = dut.shell(find_thermalctld_pid_cmd)
-        assert output["rc"] == 0, "Run command '{}' failed after restart of thermalctld on {}".format(find_thermalctld_pid_cmd, dut.hostname)
-        assert len(output["stdout_lines"]) >= 2, "There should be at least 2 thermalctld process"
+        assert int(process_counts.get('POST', 0)) >= 2, \
+            "There should be at least 2 thermalctld process after restart of thermalctld on {}".format(dut.hostname)
         logging.info("thermalctld processes restarted successfully on {}".format(dut.hostname))
         return
     # try restore by config reload...
+    from tests.common.config_reload import config_reload
     config_reload(dut)
     assert 0, 'Wait thermal control daemon restart failed'
 
@@ -295,35 +396,37 @@ def start_thermal_control_daemon(dut):
     daemon_status, _ = dut.get_pmon_daemon_status(daemon_name)
     if daemon_status != expected_running_status:
         dut.start_pmon_daemon(daemon_name)
-        wait_until(10, 2, 0, check_expected_daemon_status, dut, expected_running_status)
-    running_daemon_status, _ = dut.get_pmon_daemon_status(daemon_name)
-    assert running_daemon_status == expected_running_status, "Run command '{}' failed after starting of thermalctld on {}".format(start_pmon_daemon, dut.hostname)
+        assert _wait_daemon_status(dut, expected_running_status), \
+            "Failed to start thermalctld on {}".format(dut.hostname)
     logging.info("thermalctld processes started successfully on {}".format(dut.hostname))
 
 def stop_thermal_control_daemon(dut):
     daemon_status, _ = dut.get_pmon_daemon_status(daemon_name)
     if daemon_status == expected_running_status:
         dut.stop_pmon_daemon(daemon_name)
-        wait_until(10, 2, 0, check_expected_daemon_status, dut, expected_stopped_status)
-    stopped_daemon_status, _ = dut.get_pmon_daemon_status(daemon_name)
-    assert stopped_daemon_status == expected_stopped_status, "Run command '{}' failed after stopping of thermalctld on {}".format(stop_pmon_daemon, dut.hostname)
+        daemon_stopped = _wait_daemon_status(dut, expected_stopped_status)
+    else:
+        daemon_stopped = daemon_status == expected_stopped_status
+    assert daemon_stopped, "Failed to stop thermalctld on {}".format(dut.hostname)
     logging.info("thermalctld processes stopped successfully on {}".format(dut.hostname))
-                                                                
-class ThermalPolicyFileContext:
+
+class ThermalPolicyFileContext(object):
     """
     Context class to help replace thermal control policy file and restore it automatically.
     """
-    def __init__(self, dut, src):
+    __slots__ = ('dut', 'src', 'thermal_policy_file_path', 'thermal_policy_file_backup_path')
+
+    def __init__(self, dut, src, platform=None):
         """
         Constructor of ThermalPolicyFileContext.
         :param dut: DUT object representing a SONiC switch under test.
         :param src: Local policy file path.
+        :param platform: Platform string of the DUT. Looked up from the DUT if not given.
         """
         self.dut = dut
         self.src = src
-        platform_str = dut.facts['platform']
-        self.thermal_policy_file_path = DUT_THERMAL_POLICY_FILE.format(platform_str)
-        self.thermal_policy_file_backup_path = DUT_THERMAL_POLICY_BACKUP_FILE.format(platform_str)
+        platform_str = platform if platform is not None else _get_platform(dut)
+        self.thermal_policy_file_path, self.thermal_policy_file_backup_path = _policy_paths(platform_str)
 
     def __enter__(self):
         """
@@ -331,12 +434,13 @@ class ThermalPolicyFileContext:
         thermal control daemon to make it effect.
         :return:
         """
-        out = self.dut.stat(path=self.thermal_policy_file_path)
-        if out['stat']['exists']:
-            self.dut.command('mv -f {} {}'.format(self.thermal_policy_file_path, self.thermal_policy_file_backup_path))
-        else:
+        # Stage the new policy file next to the original one, then back up and replace in a single shell call
+        new_policy_file_path = self.thermal_policy_file_path + '.new'
+        self.dut.copy(src=os.path.join(FILES_DIR, self.src), dest=new_policy_file_path)
+        out = self.dut.shell('if [ -f {0} ]; then mv -f {0} {1}; else echo not_found; fi; mv -f {2} {0}'.format(
+            self.thermal_policy_file_path, self.thermal_policy_file_backup_path, new_policy_file_path))
+        if 'not_found' in out['stdout']:
             logging.warning("Thermal Policy file {} not found".format(self.thermal_policy_file_path))
-        self.dut.copy(src=os.path.join(FILES_DIR, self.src), dest=self.thermal_policy_file_path)
         restart_thermal_control_daemon(self.dut)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -347,9 +451,12 @@ class ThermalPolicyFileContext:
         :param exc_tb: Not used.
         :return:
         """
-        out = self.dut.stat(path=self.thermal_policy_file_backup_path)
-        if out['stat']['exists']:
-            self.dut.command('mv -f {} {}'.format(self.thermal_policy_file_backup_path, self.thermal_policy_file_path))
+        out = self.dut.shell('if [ -f {0} ]; then mv -f {0} {1} && echo restored; fi'.format(
+            self.thermal_policy_file_backup_path, self.thermal_policy_file_path), module_ignore_errors=True)
+        if out['rc'] != 0:
+            logging.warning("Failed to restore thermal policy file {}: {}".format(
+                self.thermal_policy_file_path, out['stderr']))
+        if 'restored' in out['stdout']:
             restart_thermal_control_daemon(self.dut)
 
 